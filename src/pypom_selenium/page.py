@@ -3,7 +3,8 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import collections.abc
-from typing import Any, Iterable, Optional
+import string
+from typing import Any, FrozenSet, Optional
 import urllib.parse as urlparse
 from urllib.parse import urlencode
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -13,10 +14,22 @@ from .exception import UsageError
 from .view import WebView
 
 
-def iterable(arg: Any) -> Iterable[Any]:
-    if isinstance(arg, collections.abc.Iterable) and not isinstance(arg, str):
+def query_value(arg: Any) -> Any:
+    # urlencode(doseq=True) only expands values with a len(), so materialise
+    # generators and other iterators to keep them multi-valued.
+    if isinstance(arg, (str, bytes)) or not isinstance(arg, collections.abc.Iterable):
         return arg
-    return [arg]
+    return list(arg)
+
+
+def template_fields(template: Optional[str]) -> FrozenSet[str]:
+    if template is None:
+        return frozenset()
+    return frozenset(
+        name.partition(".")[0].partition("[")[0]
+        for _, name, _, _ in string.Formatter().parse(template)
+        if name
+    )
 
 
 class Page(WebView):
@@ -62,6 +75,9 @@ class Page(WebView):
 
     """
 
+    _parsed_url_template: Optional[str] = None
+    _url_template_fields: FrozenSet[str] = frozenset()
+
     def __init__(
         self,
         driver: WebDriver,
@@ -72,6 +88,13 @@ class Page(WebView):
         super().__init__(driver, timeout)
         self.base_url = base_url or ""
         self.url_kwargs = url_kwargs
+        self._seed_url: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The field names are only valid while URL_TEMPLATE is still this string.
+        cls._parsed_url_template = cls.URL_TEMPLATE
+        cls._url_template_fields = template_fields(cls.URL_TEMPLATE)
 
     @property
     def seed_url(self) -> str:
@@ -79,35 +102,54 @@ class Page(WebView):
 
         The URL is formatted from `URL_TEMPLATE`, which is then
         appended to `base_url` unless the template results in an
-        absolute URL.
+        absolute URL. The result is computed on first access and reused
+        for the lifetime of the page object.
 
         :return: URL that can be used to open the page.
         :rtype: str
 
         """
+        if self._seed_url is None:
+            self._seed_url = self._compute_seed_url()
+        return self._seed_url
+
+    def _compute_seed_url(self) -> str:
         url = self.base_url
         if self.URL_TEMPLATE is not None:
             url = urlparse.urljoin(
-                self.base_url, self.URL_TEMPLATE.format(**self.url_kwargs)
+                self.base_url, self.URL_TEMPLATE.format_map(self.url_kwargs)
             )
 
         if not url:
             raise UsageError(
                 "Set a base URL or URL_TEMPLATE to be able to use the seed_url."
             )
-
-        url_parts = list(urlparse.urlparse(url))
-        query = urlparse.parse_qsl(url_parts[4])
-
-        for k, v in self.url_kwargs.items():
-            if v is None:
-                continue
-            if f"{{{k}}}" not in str(self.URL_TEMPLATE):
-                for i in iterable(v):
-                    query.append((k, i))
-
-        url_parts[4] = urlencode(query)
-        return urlparse.urlunparse(url_parts)
+        path, hash_, fragment = url.partition("#")
+        has_query = "?" in path
+        if not self.url_kwargs and not has_query:
+            return url
+
+        fields = self._url_template_fields
+        if self.URL_TEMPLATE is not self._parsed_url_template:
+            fields = template_fields(self.URL_TEMPLATE)
+
+        query = [
+            (k, query_value(v))
+            for k, v in self.url_kwargs.items()
+            if v is not None and k not in fields
+        ]
+
+        if has_query:
+            # Re-encode an existing query so that values formatted into it
+            # by URL_TEMPLATE are quoted.
+            url_parts = list(urlparse.urlparse(url))
+            url_parts[4] = urlencode(
+                urlparse.parse_qsl(url_parts[4]) + query, doseq=True
+            )
+            return urlparse.urlunparse(url_parts)
+        if not query:
+            return url
+        return path + "?" + urlencode(query, doseq=True) + hash_ + fragment
 
     def open(self) -> Self:
         """Open the page.
@@ -124,8 +166,11 @@ class Page(WebView):
         return self
 
     def wait_for_page_to_load(self) -> Self:
-        """Wait for the page to load."""
-        self.wait.until(lambda _: self.loaded)
+        """Wait for the page to load.
+
+        Waits for `LOADED_CONDITION` when set, otherwise for `loaded`.
+        """
+        self._wait_until_loaded()
         return self
 
     @property
@@ -157,5 +202,11 @@ class Page(WebView):
             # wait for the seed_url value to be in the current URL
             self.seed_url in self.selenium.current_url
 
+            # read several values with a single driver round-trip
+            state = self.query_state(
+                "return {cls: document.body.className, url: location.href}"
+            )
+            'loaded' in state['cls'] and self.seed_url in state['url']
+
         """
         return True
@@ -2,8 +2,9 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-from typing import Generic, List, Optional, Tuple
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple
 from typing_extensions import TypeVar, Self
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement
 
 from .exception import UsageError
@@ -11,6 +12,7 @@ from .page import Page
 from .view import WebView
 
 T = TypeVar("T", default=Page, bound=Page)
+R = TypeVar("R")
 
 
 class Region(WebView, Generic[T]):
@@ -51,11 +53,37 @@ class Region(WebView, Generic[T]):
 
     _root_locator: Optional[Tuple[str, str]] = None
 
+    _wait_on_init: bool = False
+
+    _cache_root: bool = False
+    """Reuse the element found with `_root_locator` between root lookups.
+
+    When enabled the root element is only looked up again once the cached
+    element has gone stale, which is detected when the region's
+    ``find_element[s]`` and ``is_element_*`` methods use it. The cached
+    element is also dropped by `wait_for_region_to_load` and `_reset_root`.
+    Other direct use of `root`, e.g. ``self.root.click()``, is not
+    revalidated.
+    """
+
+    # pylint: disable-next=super-init-not-called
     def __init__(self, page: T, root: Optional[WebElement] = None):
-        super().__init__(page.driver, page.timeout)
+        # Reuse the page's driver adapter rather than looking it up again.
+        self._bind_adapter(page.driver_adapter, page.timeout)
         self._root = root
+        self._resolved_root: Optional[WebElement] = None
         self.page = page
-        self.wait_for_region_to_load()
+        if self._wait_on_init:
+            self.wait_for_region_to_load()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # With the default loaded state there is nothing to wait for.
+        cls._wait_on_init = (
+            cls.loaded is not Region.loaded
+            or cls.wait_for_region_to_load is not Region.wait_for_region_to_load
+            or cls.LOADED_CONDITION is not None
+        )
 
     @property
     def root(self) -> WebElement:
@@ -66,24 +94,47 @@ class Region(WebView, Generic[T]):
         reduce the chances of hitting
         `~selenium.common.exceptions.StaleElementReferenceException` or similar
         you should use `_root_locator`, as this is looked up every time the
-        `root` property is accessed.
+        `root` property is accessed unless `_cache_root` is set.
         """
         if self._root is not None:
             return self._root
 
         if self._root_locator is not None:
+            if self._resolved_root is not None:
+                return self._resolved_root
             strategy, locator = self._root_locator
-            return self.page.find_element(strategy, locator)
+            root = self.page.find_element(strategy, locator)
+            if self._cache_root:
+                self._resolved_root = root
+            return root
 
         raise UsageError(
             "Set a root element or define a _root_locator to be able to use the root property."
         )
 
+    def _with_root(self, func: Callable[..., R], *args: Any) -> R:
+        try:
+            return func(*args, root=self.root)
+        except StaleElementReferenceException:
+            if self._resolved_root is None:
+                raise
+            self._reset_root()
+            return func(*args, root=self.root)
+
     def wait_for_region_to_load(self) -> Self:
-        """Wait for the page region to load."""
-        self.wait.until(lambda _: self.loaded)
+        """Wait for the page region to load.
+
+        Waits for `LOADED_CONDITION` when set, otherwise for `loaded`.
+        A root element cached with `_cache_root` is looked up again first.
+        """
+        self._reset_root()
+        self._wait_until_loaded()
         return self
 
+    def _reset_root(self) -> None:
+        """Drop the root element cached with `_cache_root`."""
+        self._resolved_root = None
+
     def find_element(self, strategy: str, locator: str) -> WebElement:
         """Finds an element on the page.
 
@@ -95,7 +146,7 @@ class Region(WebView, Generic[T]):
         :rytpe: `~selenium.webdriver.remote.webelement.WebElement`
 
         """
-        return self.driver_adapter.find_element(strategy, locator, root=self.root)
+        return self._with_root(self.driver_adapter.find_element, strategy, locator)
 
     def find_elements(self, strategy: str, locator: str) -> List[WebElement]:
         """Finds elements on the page.
@@ -108,7 +159,34 @@ class Region(WebView, Generic[T]):
         :rtype: list
 
         """
-        return self.driver_adapter.find_elements(strategy, locator, root=self.root)
+        return self._with_root(self.driver_adapter.find_elements, strategy, locator)
+
+    def find_elements_batch(
+        self, locators: Sequence[Tuple[str, str]]
+    ) -> List[Optional[WebElement]]:
+        """Finds the first element for each of several locators at once.
+
+        :param locators: (strategy, locator) pairs. See `~selenium.webdriver.common.by.By`.
+        :type locators: list
+        :return: List of `~selenium.webdriver.remote.webelement.WebElement`,
+            with ``None`` for locators that matched nothing.
+        :rtype: list
+
+        """
+        return self._with_root(self.driver_adapter.find_elements_batch, locators)
+
+    def find_elements_parallel(
+        self, locators: Sequence[Tuple[str, str]]
+    ) -> List[WebElement]:
+        """Finds an element for each of several locators concurrently.
+
+        :param locators: (strategy, locator) pairs. See `~selenium.webdriver.common.by.By`.
+        :type locators: list
+        :return: List of `~selenium.webdriver.remote.webelement.WebElement`
+        :rtype: list
+
+        """
+        return self._with_root(self.driver_adapter.find_elements_parallel, locators)
 
     def is_element_present(self, strategy: str, locator: str) -> bool:
         """Checks whether an element is present.
@@ -121,7 +199,9 @@ class Region(WebView, Generic[T]):
         :rtype: bool
 
         """
-        return self.driver_adapter.is_element_present(strategy, locator, root=self.root)
+        return self._with_root(
+            self.driver_adapter.is_element_present, strategy, locator
+        )
 
     def is_element_displayed(self, strategy: str, locator: str) -> bool:
         """Checks whether an element is displayed.
@@ -134,8 +214,8 @@ class Region(WebView, Generic[T]):
         :rtype: bool
 
         """
-        return self.driver_adapter.is_element_displayed(
-            strategy, locator, root=self.root
+        return self._with_root(
+            self.driver_adapter.is_element_displayed, strategy, locator
         )
 
     @property
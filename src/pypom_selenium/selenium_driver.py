@@ -3,25 +3,69 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import NoSuchElementException
 
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY
+
+# Strategies that can be resolved in the browser, mapped to the equivalent
+# CSS selector (the same translation Selenium applies for W3C drivers).
+_CSS_SELECTORS: Dict[str, str] = {
+    By.CSS_SELECTOR: "{}",
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
+_FIND_BATCH_SCRIPT = """
+var root = arguments[1] || document;
+return arguments[0].map(function (query) {
+    if (query[0] === "xpath") {
+        return document.evaluate(
+            query[1], root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return root.querySelector(query[1]);
+});
+"""
+
+
+def _batch_query(strategy: str, locator: str) -> Optional[Tuple[str, str]]:
+    if strategy == By.XPATH:
+        return ("xpath", locator)
+    selector = _CSS_SELECTORS.get(strategy)
+    if selector is None:
+        return None
+    return ("css", selector.format(locator))
 
 
 class Selenium:
     def __init__(self, driver: WebDriver):
         self.driver = driver
+        self._waits: Dict[Tuple[float, float], WebDriverWait[WebDriver]] = {}
 
-    def wait_factory(self, timeout: float) -> WebDriverWait[WebDriver]:
+    def wait_factory(
+        self, timeout: float, poll_frequency: float = POLL_FREQUENCY
+    ) -> WebDriverWait[WebDriver]:
         """Returns a WebDriverWait like property for a given timeout.
 
+        Waits are reused for repeated calls with the same arguments.
+
         :param timeout: Timeout used by WebDriverWait calls
+        :param poll_frequency: (optional) Sleep interval between condition checks
         :type timeout: int
+        :type poll_frequency: float
         """
-        return WebDriverWait(self.driver, timeout)
+        wait = self._waits.get((timeout, poll_frequency))
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency)
+            self._waits[(timeout, poll_frequency)] = wait
+        return wait
 
     def open(self, url: str) -> None:
         """Open the page.
@@ -29,6 +73,17 @@ class Selenium:
         """
         self.driver.get(url)
 
+    def eval_js(self, script: str, *args: Any) -> Any:
+        """Executes JavaScript in the current page.
+
+        :param script: JavaScript to execute.
+        :param args: (optional) arguments available to the script as ``arguments``.
+        :type script: str
+        :return: The value returned by the script.
+
+        """
+        return self.driver.execute_script(script, *args)
+
     def find_element(
         self, strategy: str, locator: str, root: Optional[WebElement] = None
     ) -> WebElement:
@@ -69,6 +124,65 @@ class Selenium:
             return root.find_elements(strategy, locator)
         return self.driver.find_elements(strategy, locator)
 
+    def find_elements_batch(
+        self, locators: Sequence[Tuple[str, str]], root: Optional[WebElement] = None
+    ) -> List[Optional[WebElement]]:
+        """Finds the first element for each of several locators at once.
+
+        Locators using CSS selector, ID, name, class name, tag name or XPath
+        strategies are resolved together with a single script execution.
+        Other strategies are looked up individually.
+
+        :param locators: (strategy, locator) pairs. See
+        `~selenium.webdriver.common.by.By` for valid strategies.
+        :param root: (optional) root node.
+        :type locators: list
+        :type root: str `~selenium.webdriver.remote.webelement.WebElement` object or None.
+        :return: `~selenium.webdriver.remote.webelement.WebElement` objects, in
+        the order of `locators`, with ``None`` for locators that matched nothing.
+        :rtype: list
+
+        """
+        queries = [_batch_query(strategy, locator) for strategy, locator in locators]
+        batch = [query for query in queries if query is not None]
+        found = iter(self.eval_js(_FIND_BATCH_SCRIPT, batch, root) if batch else [])
+
+        elements: List[Optional[WebElement]] = []
+        for query, (strategy, locator) in zip(queries, locators):
+            if query is not None:
+                elements.append(next(found))
+                continue
+            matches = self.find_elements(strategy, locator, root=root)
+            elements.append(matches[0] if matches else None)
+        return elements
+
+    def find_elements_parallel(
+        self, locators: Sequence[Tuple[str, str]], root: Optional[WebElement] = None
+    ) -> List[WebElement]:
+        """Finds an element for each of several locators concurrently.
+
+        The lookups are issued from a small thread pool so their round-trips
+        overlap. Only use this for read-only queries.
+
+        :param locators: (strategy, locator) pairs. See
+        `~selenium.webdriver.common.by.By` for valid strategies.
+        :param root: (optional) root node.
+        :type locators: list
+        :type root: str `~selenium.webdriver.remote.webelement.WebElement` object or None.
+        :return: `~selenium.webdriver.remote.webelement.WebElement` objects, in
+        the order of `locators`.
+        :rtype: list
+
+        """
+        if not locators:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(locators), 4)) as executor:
+            futures = [
+                executor.submit(self.find_element, strategy, locator, root)
+                for strategy, locator in locators
+            ]
+            return [future.result() for future in futures]
+
     def is_element_present(
         self, strategy: str, locator: str, root: Optional[WebElement] = None
     ) -> bool:
@@ -85,11 +199,9 @@ class Selenium:
         :rtype: bool
 
         """
-        try:
-            self.find_element(strategy, locator, root=root)
-            return True
-        except NoSuchElementException:
-            return False
+        if root is not None:
+            return bool(root.find_elements(strategy, locator))
+        return bool(self.driver.find_elements(strategy, locator))
 
     def is_element_displayed(
         self, strategy: str, locator: str, root: Optional[WebElement] = None
@@ -107,7 +219,8 @@ class Selenium:
         :rtype: bool
 
         """
-        try:
-            return self.find_element(strategy, locator, root=root).is_displayed()
-        except NoSuchElementException:
-            return False
+        if root is not None:
+            elements = root.find_elements(strategy, locator)
+        else:
+            elements = self.driver.find_elements(strategy, locator)
+        return bool(elements) and elements[0].is_displayed()
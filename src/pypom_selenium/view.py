@@ -2,18 +2,62 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-from typing import List
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+import weakref
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from .selenium_driver import Selenium
 
+# Adapters are shared by all views using the same driver. Entries are dropped
+# once the last view referencing them is gone, and as each adapter keeps its
+# driver alive an id() key cannot be reused while the entry exists.
+_adapters: "weakref.WeakValueDictionary[int, Selenium]" = weakref.WeakValueDictionary()
+
 
 class WebView:
+    LOADED_CONDITION: Optional[Callable[[WebDriver], Any]] = None
+    """Condition waited for instead of polling `loaded`.
+
+    Any callable accepted by `~selenium.webdriver.support.ui.WebDriverWait.until`,
+    typically one of the `~selenium.webdriver.support.expected_conditions`. It
+    is called with the driver directly, saving the `loaded` property dispatch
+    on every poll. It may also be set on an instance, but whether a region
+    waits on construction is decided from its class.
+
+    Example::
+
+        LOADED_CONDITION = EC.presence_of_element_located((By.ID, 'content'))
+
+    """
+
+    POLL_FREQUENCY: float = 0.25
+    """Interval in seconds between checks of the loaded state while waiting."""
+
     def __init__(self, driver: WebDriver, timeout: float):
-        self.driver = driver
-        self.driver_adapter = Selenium(driver)
+        adapter = _adapters.get(id(driver))
+        if adapter is None:
+            adapter = _adapters[id(driver)] = Selenium(driver)
+        self._bind_adapter(adapter, timeout)
+
+    def _bind_adapter(self, driver_adapter: Selenium, timeout: float) -> None:
+        self.driver = driver_adapter.driver
+        self.driver_adapter = driver_adapter
         self.timeout = timeout
-        self.wait = self.driver_adapter.wait_factory(self.timeout)
+
+        self.wait = driver_adapter.wait_factory(timeout, self.POLL_FREQUENCY)
+
+    @property
+    def loaded(self) -> bool:
+        return True
+
+    def _wait_until_loaded(self) -> None:
+        # Looked up on the class unless set on the instance, so that a plain
+        # function assigned in the class body is not bound as a method.
+        condition = vars(self).get("LOADED_CONDITION", type(self).LOADED_CONDITION)
+        if condition is not None:
+            self.wait.until(condition)
+        else:
+            self.wait.until(lambda _: self.loaded)
 
     def find_element(self, strategy: str, locator: str) -> WebElement:
         return self.driver_adapter.find_element(strategy, locator)
@@ -31,6 +75,39 @@ class WebView:
         """
         return self.driver_adapter.find_elements(strategy, locator)
 
+    def find_elements_batch(
+        self, locators: Sequence[Tuple[str, str]]
+    ) -> List[Optional[WebElement]]:
+        """Finds the first element for each of several locators at once.
+
+        Where possible all locators are resolved with a single driver
+        round-trip, instead of one `find_element` call per locator.
+
+        :param locators: (strategy, locator) pairs. See `~selenium.webdriver.common.by.By`.
+        :type locators: list
+        :return: List of `~selenium.webdriver.remote.webelement.WebElement`,
+            with ``None`` for locators that matched nothing.
+        :rtype: list
+
+        """
+        return self.driver_adapter.find_elements_batch(locators)
+
+    def find_elements_parallel(
+        self, locators: Sequence[Tuple[str, str]]
+    ) -> List[WebElement]:
+        """Finds an element for each of several locators concurrently.
+
+        Useful in `loaded` predicates that read several independent elements.
+        Only use this for read-only queries.
+
+        :param locators: (strategy, locator) pairs. See `~selenium.webdriver.common.by.By`.
+        :type locators: list
+        :return: List of `~selenium.webdriver.remote.webelement.WebElement`
+        :rtype: list
+
+        """
+        return self.driver_adapter.find_elements_parallel(locators)
+
     def is_element_present(self, strategy: str, locator: str) -> bool:
         """Checks whether an element is present.
 
@@ -56,3 +133,23 @@ class WebView:
 
         """
         return self.driver_adapter.is_element_displayed(strategy, locator)
+
+    def query_state(self, script: str, *args: Any) -> Any:
+        """Reads state from the page with a single script execution.
+
+        Reading several values with one script, e.g. in `loaded`, costs one
+        driver round-trip instead of one per element and attribute.
+
+        :param script: JavaScript returning the wanted state.
+        :param args: (optional) arguments available to the script as ``arguments``.
+        :type script: str
+        :return: The value returned by the script.
+
+        Usage::
+
+          state = self.query_state(
+              "return {cls: document.body.className, url: location.href}"
+          )
+
+        """
+        return self.driver_adapter.eval_js(script, *args)
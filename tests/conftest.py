@@ -2,6 +2,9 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import itertools
+from typing import Callable
+
 import pytest
 from mock import Mock
 
@@ -15,6 +18,19 @@ def base_url() -> str:
     return "https://www.mozilla.org/"
 
 
+@pytest.fixture
+def base_q(base_url: str) -> str:
+    """Base URL followed by the start of a ``key`` query parameter"""
+    return base_url + "?key="
+
+
+@pytest.fixture
+def token() -> Callable[[], str]:
+    """Distinct values for URL tokens and parameters"""
+    counter = itertools.count()
+    return lambda: f"v{next(counter)}"
+
+
 @pytest.fixture
 def element(driver: Mock) -> Mock:
     element = Mock()
@@ -3,15 +3,22 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import re
-import random
+from typing import Any, Callable
 import pytest
+from mock import Mock, patch
 from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from typing_extensions import Self
 
 from pypom_selenium import Page
 from pypom_selenium.exception import UsageError
 
+_MULTI_PARAM_RE = re.compile(r"\?key=(foo|bar)&key=(foo|bar)$")
+_MULTI_PARAM_SPECIAL_RE = re.compile(
+    r"\?key=(foo|mozilla%26co)&key=(foo|mozilla%26co)$"
+)
+
 
 def test_base_url(base_url: str, page: Page) -> None:
     assert base_url == page.seed_url
@@ -27,8 +34,10 @@ def test_seed_url_absolute(base_url: str, driver: WebDriver) -> None:
     assert url_template == page.seed_url
 
 
-def test_seed_url_absolute_keywords_tokens(base_url: str, driver: WebDriver) -> None:
-    value = str(random.random())
+def test_seed_url_absolute_keywords_tokens(
+    base_url: str, driver: WebDriver, token: Callable[[], str]
+) -> None:
+    value = token()
     absolute_url = "https://www.test.com/"
 
     class MyPage(Page):
@@ -38,8 +47,10 @@ def test_seed_url_absolute_keywords_tokens(base_url: str, driver: WebDriver) ->
     assert absolute_url + value == page.seed_url
 
 
-def test_seed_url_absolute_keywords_params(base_url: str, driver: WebDriver) -> None:
-    value = str(random.random())
+def test_seed_url_absolute_keywords_params(
+    base_url: str, driver: WebDriver, token: Callable[[], str]
+) -> None:
+    value = token()
     absolute_url = "https://www.test.com/"
 
     class MyPage(Page):
@@ -63,9 +74,9 @@ def test_seed_url_absolute_keywords_params_none(
 
 
 def test_seed_url_absolute_keywords_tokens_and_params(
-    base_url: str, driver: WebDriver
+    base_url: str, driver: WebDriver, token: Callable[[], str]
 ) -> None:
-    values = (str(random.random()), str(random.random()))
+    values = (token(), token())
     absolute_url = "https://www.test.com/"
 
     class MyPage(Page):
@@ -75,14 +86,69 @@ def test_seed_url_absolute_keywords_tokens_and_params(
     assert f"{absolute_url}?key1={values[0]}&key2={values[1]}" == page.seed_url
 
 
+def test_seed_url_inherited_template(base_url: str, driver: WebDriver) -> None:
+    class MyPage(Page):
+        URL_TEMPLATE = "?key1={key1}"
+
+    class MySubPage(MyPage):
+        pass
+
+    page = MySubPage(driver, base_url, key1="foo", key2="bar")
+    assert f"{base_url}?key1=foo&key2=bar" == page.seed_url
+
+
+def test_seed_url_template_changed(base_url: str, driver: WebDriver) -> None:
+    class MyPage(Page):
+        URL_TEMPLATE = "a/{key}"
+
+    class MyInstancePage(MyPage):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            self.URL_TEMPLATE = "b/{other}"
+
+    instance_page = MyInstancePage(driver, base_url, key="foo", other="bar")
+    assert base_url + "b/bar?key=foo" == instance_page.seed_url
+
+    MyPage.URL_TEMPLATE = "c/{other}"
+    page = MyPage(driver, base_url, key="foo", other="bar")
+    assert base_url + "c/bar?key=foo" == page.seed_url
+
+
+def test_seed_url_static_template_changed(base_url: str, driver: WebDriver) -> None:
+    class MyPage(Page):
+        URL_TEMPLATE = "a"
+
+    class MyInstancePage(MyPage):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            self.URL_TEMPLATE = "b/{key}"
+
+    instance_page = MyInstancePage(driver, base_url, key="foo")
+    assert base_url + "b/foo" == instance_page.seed_url
+
+    MyPage.URL_TEMPLATE = "c/{key}"
+    page = MyPage(driver, base_url, key="foo")
+    assert base_url + "c/foo" == page.seed_url
+
+
+def test_seed_url_escaped_braces(base_url: str, driver: WebDriver) -> None:
+    class MyPage(Page):
+        URL_TEMPLATE = "{{key}}"
+
+    page = MyPage(driver, base_url, key="foo")
+    assert base_url + "{key}?key=foo" == page.seed_url
+
+
 def test_seed_url_empty(driver: WebDriver) -> None:
     page = Page(driver)
     with pytest.raises(UsageError):
         page.seed_url
 
 
-def test_seed_url_keywords_tokens(base_url: str, driver: WebDriver) -> None:
-    value = str(random.random())
+def test_seed_url_keywords_tokens(
+    base_url: str, driver: WebDriver, token: Callable[[], str]
+) -> None:
+    value = token()
 
     class MyPage(Page):
         URL_TEMPLATE = "{key}"
@@ -91,22 +157,35 @@ def test_seed_url_keywords_tokens(base_url: str, driver: WebDriver) -> None:
     assert base_url + value == page.seed_url
 
 
-def test_seed_url_keywords_params(base_url: str, driver: WebDriver) -> None:
-    value = str(random.random())
+def test_seed_url_keywords_params(
+    base_url: str, base_q: str, driver: WebDriver, token: Callable[[], str]
+) -> None:
+    value = token()
     page = Page(driver, base_url, key=value)
-    assert f"{base_url}?key={value}" == page.seed_url
+    assert base_q + value == page.seed_url
 
 
-def test_seed_url_keywords_params_space(base_url: str, driver: WebDriver) -> None:
+def test_seed_url_keywords_params_space(
+    base_url: str, base_q: str, driver: WebDriver
+) -> None:
     value = "a value"
     page = Page(driver, base_url, key=value)
-    assert f"{base_url}?key=a+value" == page.seed_url
+    assert base_q + "a+value" == page.seed_url
 
 
-def test_seed_url_keywords_params_special(base_url: str, driver: WebDriver) -> None:
+def test_seed_url_keywords_params_special(
+    base_url: str, base_q: str, driver: WebDriver
+) -> None:
     value = "mozilla&co"
     page = Page(driver, base_url, key=value)
-    assert f"{base_url}?key=mozilla%26co" == page.seed_url
+    assert base_q + "mozilla%26co" == page.seed_url
+
+
+def test_seed_url_keywords_params_number(
+    base_url: str, base_q: str, driver: WebDriver
+) -> None:
+    page = Page(driver, base_url, key=1)
+    assert base_q + "1" == page.seed_url
 
 
 def test_seed_url_keywords_multiple_params(base_url: str, driver: WebDriver) -> None:
@@ -117,7 +196,18 @@ def test_seed_url_keywords_multiple_params(base_url: str, driver: WebDriver) ->
     assert f"key={value[0]}" in seed_url
     assert f"key={value[1]}" in seed_url
 
-    assert re.match(rf"{base_url}\?key=(foo|bar)&key=(foo|bar)", seed_url)
+    assert seed_url.startswith(base_url)
+    assert _MULTI_PARAM_RE.match(seed_url[len(base_url) :])
+
+
+def test_seed_url_keywords_multiple_params_iterator(
+    base_q: str, base_url: str, driver: WebDriver
+) -> None:
+    page = Page(driver, base_url, key=(value for value in ("foo", "bar")))
+    assert base_q + "foo&key=bar" == page.seed_url
+
+    page = Page(driver, base_url, key=iter(["foo", "bar"]))
+    assert base_q + "foo&key=bar" == page.seed_url
 
 
 def test_seed_url_keywords_multiple_params_special(
@@ -130,15 +220,14 @@ def test_seed_url_keywords_multiple_params_special(
     assert "key=foo" in seed_url
     assert "key=mozilla%26co" in seed_url
 
-    assert re.match(
-        rf"{base_url}\?key=(foo|mozilla%26co)&key=(foo|mozilla%26co)", seed_url
-    )
+    assert seed_url.startswith(base_url)
+    assert _MULTI_PARAM_SPECIAL_RE.match(seed_url[len(base_url) :])
 
 
 def test_seed_url_keywords_keywords_and_params(
-    base_url: str, driver: WebDriver
+    base_url: str, driver: WebDriver, token: Callable[[], str]
 ) -> None:
-    values = (str(random.random()), str(random.random()))
+    values = (token(), token())
 
     class MyPage(Page):
         URL_TEMPLATE = "?key1={key1}"
@@ -147,8 +236,36 @@ def test_seed_url_keywords_keywords_and_params(
     assert f"{base_url}?key1={values[0]}&key2={values[1]}" == page.seed_url
 
 
-def test_seed_url_prepend(base_url: str, driver: WebDriver) -> None:
-    url_template = str(random.random())
+def test_seed_url_keywords_tokens_in_query(base_url: str, driver: WebDriver) -> None:
+    class MyPage(Page):
+        URL_TEMPLATE = "search?q={term}"
+
+    page = MyPage(driver, base_url, term="a b", key="c&d")
+    assert f"{base_url}search?q=a+b&key=c%26d" == page.seed_url
+
+    page = MyPage(driver, base_url, term="a b")
+    assert f"{base_url}search?q=a+b" == page.seed_url
+
+
+def test_seed_url_keywords_params_existing_query(
+    base_url: str, driver: WebDriver
+) -> None:
+    page = Page(driver, base_url + "?key1=foo", key2="bar")
+    assert f"{base_url}?key1=foo&key2=bar" == page.seed_url
+
+
+def test_seed_url_keywords_params_fragment(base_url: str, driver: WebDriver) -> None:
+    class MyPage(Page):
+        URL_TEMPLATE = "{path}#top"
+
+    page = MyPage(driver, base_url, path="search", key="foo")
+    assert f"{base_url}search?key=foo#top" == page.seed_url
+
+
+def test_seed_url_prepend(
+    base_url: str, driver: WebDriver, token: Callable[[], str]
+) -> None:
+    url_template = token()
 
     class MyPage(Page):
         URL_TEMPLATE = url_template
@@ -157,6 +274,24 @@ def test_seed_url_prepend(base_url: str, driver: WebDriver) -> None:
     assert base_url + url_template == page.seed_url
 
 
+def test_seed_url_cached(base_url: str, driver: WebDriver) -> None:
+    page = Page(driver, base_url, key="value")
+    assert page.seed_url is page.seed_url
+
+
+def test_driver_adapter_shared(page: Page, driver: WebDriver) -> None:
+    other = Page(driver)
+    assert other.driver_adapter is page.driver_adapter
+    assert other.wait is page.wait
+    assert Page(driver, timeout=0).wait is not page.wait
+
+
+def test_patch_instance(page: Page) -> None:
+    with patch.object(page, "open") as open_:
+        page.open()
+    open_.assert_called_once_with()
+
+
 def test_open(page: Page) -> None:
     assert isinstance(page.open(), Page)
 
@@ -220,9 +355,100 @@ def test_wait_for_page_timeout_loaded(base_url: str, driver: WebDriver) -> None:
         page.wait_for_page_to_load()
 
 
+def test_wait_for_page_loaded_condition(base_url: str, driver: WebDriver) -> None:
+    condition = Mock(return_value=True)
+
+    class MyPage(Page):
+        LOADED_CONDITION = condition
+
+    assert isinstance(MyPage(driver, base_url).wait_for_page_to_load(), Page)
+    condition.assert_called_once_with(driver)
+
+
+def test_wait_for_page_instance_loaded_condition(
+    base_url: str, driver: WebDriver
+) -> None:
+    page = Page(driver, base_url)
+    page.LOADED_CONDITION = Mock(return_value=True)
+
+    assert isinstance(page.wait_for_page_to_load(), Page)
+    page.LOADED_CONDITION.assert_called_once_with(driver)
+
+
+def test_wait_for_page_timeout_loaded_condition(
+    base_url: str, driver: WebDriver
+) -> None:
+    class MyPage(Page):
+        LOADED_CONDITION = Mock(return_value=False)
+
+    page = MyPage(driver, base_url, timeout=0)
+
+    with pytest.raises(TimeoutException):
+        page.wait_for_page_to_load()
+
+
 def test_wait_for_page_empty_base_url(driver: WebDriver) -> None:
     assert isinstance(Page(driver).wait_for_page_to_load(), Page)
 
 
+def test_is_element_present(page: Page, driver: Mock) -> None:
+    driver.find_elements.return_value = [Mock()]
+    assert page.is_element_present(By.ID, "test")
+    driver.find_elements.return_value = []
+    assert not page.is_element_present(By.ID, "test")
+    driver.find_element.assert_not_called()
+
+
+def test_is_element_displayed(page: Page, driver: Mock) -> None:
+    element = Mock()
+    element.is_displayed.return_value = True
+    driver.find_elements.return_value = [element]
+    assert page.is_element_displayed(By.ID, "test")
+    element.is_displayed.return_value = False
+    assert not page.is_element_displayed(By.ID, "test")
+    driver.find_elements.return_value = []
+    assert not page.is_element_displayed(By.ID, "test")
+    driver.find_element.assert_not_called()
+
+
+def test_find_elements_batch(page: Page, driver: Mock) -> None:
+    first, second, third = Mock(), Mock(), Mock()
+    driver.execute_script.return_value = [first, None, second]
+    driver.find_elements.return_value = [third]
+
+    elements = page.find_elements_batch(
+        [
+            (By.ID, "a"),
+            (By.CLASS_NAME, "b"),
+            (By.LINK_TEXT, "c"),
+            (By.XPATH, "//d"),
+        ]
+    )
+
+    assert elements == [first, None, third, second]
+    assert driver.execute_script.call_count == 1
+    assert driver.execute_script.call_args[0][1:] == (
+        [("css", '[id="a"]'), ("css", ".b"), ("xpath", "//d")],
+        None,
+    )
+    driver.find_elements.assert_called_once_with(By.LINK_TEXT, "c")
+
+
+def test_find_elements_parallel(page: Page, driver: Mock) -> None:
+    elements = {"a": Mock(), "b": Mock(), "c": Mock()}
+    driver.find_element.side_effect = lambda strategy, locator: elements[locator]
+
+    found = page.find_elements_parallel([(By.ID, "c"), (By.ID, "a"), (By.ID, "b")])
+
+    assert found == [elements["c"], elements["a"], elements["b"]]
+    assert page.find_elements_parallel([]) == []
+
+
+def test_query_state(page: Page, driver: Mock) -> None:
+    driver.execute_script.return_value = {"cls": "loaded"}
+    assert page.query_state("return 1", "arg") == {"cls": "loaded"}
+    driver.execute_script.assert_called_once_with("return 1", "arg")
+
+
 def test_loaded(page: Page) -> None:
     assert page.loaded is True
@@ -3,8 +3,11 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import pytest
-from mock import Mock
-from selenium.common.exceptions import TimeoutException
+from mock import Mock, patch
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.by import By
 from typing_extensions import Self
 
@@ -39,6 +42,31 @@ class TestWaitForRegion:
         with pytest.raises(TimeoutException):
             MyRegion(page)
 
+    def test_wait_for_region_timeout_loaded_condition(self, page: Page) -> None:
+        class MyRegion(Region):
+            LOADED_CONDITION = Mock(return_value=False)
+
+        page.timeout = 0
+
+        with pytest.raises(TimeoutException):
+            MyRegion(page)
+        MyRegion.LOADED_CONDITION.assert_called_with(page.driver)
+
+    def test_wait_for_region_skipped(self, page: Page) -> None:
+        class MyRegion(Region):
+            pass
+
+        with patch.object(MyRegion, "_wait_until_loaded") as wait:
+            MyRegion(page)
+        wait.assert_not_called()
+
+
+def test_driver_adapter_shared(page: Page) -> None:
+    region = Region(page)
+    assert region.driver is page.driver
+    assert region.driver_adapter is page.driver_adapter
+    assert region.wait is page.wait
+
 
 def test_no_root(page: Page) -> None:
     with pytest.raises(UsageError):
@@ -63,3 +91,90 @@ def test_root_locator(page: Page, element: Mock) -> None:
     element = Mock()
     assert MyRegion(page, root=element).root == element
     page.driver.find_element.call_count == 1  # type: ignore
+
+
+def test_root_locator_inherited(page: Page, element: Mock) -> None:
+    class MyRegion(Region):
+        _root_locator = (By.ID, "test")
+
+    class MySubRegion(MyRegion):
+        pass
+
+    class MyRootlessRegion(MyRegion):
+        _root_locator = None  # type: ignore[assignment]
+
+    assert MySubRegion(page).root == element
+    page.driver.find_element.assert_called_once_with(By.ID, "test")  # type: ignore
+    with pytest.raises(UsageError):
+        MyRootlessRegion(page).root
+
+
+def test_root_locator_instance(page: Page, element: Mock) -> None:
+    class MyRegion(Region):
+        def __init__(self, page: Page, index: int):
+            self._root_locator = (By.CSS_SELECTOR, f"li:nth-child({index})")
+            super().__init__(page)
+
+    assert MyRegion(page, 2).root == element
+    page.driver.find_element.assert_called_once_with(  # type: ignore
+        By.CSS_SELECTOR, "li:nth-child(2)"
+    )
+
+
+def test_root_locator_cached(page: Page, element: Mock) -> None:
+    class MyRegion(Region):
+        _root_locator = (By.ID, "test")
+        _cache_root = True
+
+    region = MyRegion(page)
+    assert region.root == element
+    assert region.root == element
+    page.driver.find_element.assert_called_once_with(By.ID, "test")  # type: ignore
+
+
+def test_root_locator_cached_stale(page: Page, element: Mock) -> None:
+    class MyRegion(Region):
+        _root_locator = (By.ID, "test")
+        _cache_root = True
+
+    child = Mock()
+    element.find_element.side_effect = [StaleElementReferenceException(), child]
+
+    assert MyRegion(page).find_element(By.ID, "child") == child
+    assert page.driver.find_element.call_count == 2  # type: ignore
+
+
+def test_find_elements_batch(page: Page, element: Mock) -> None:
+    class MyRegion(Region):
+        _root_locator = (By.ID, "test")
+
+    page.driver.execute_script.return_value = [None]  # type: ignore
+
+    assert MyRegion(page).find_elements_batch([(By.ID, "a")]) == [None]
+    page.driver.execute_script.assert_called_once()  # type: ignore
+    assert page.driver.execute_script.call_args[0][2] == element  # type: ignore
+
+
+def test_root_locator_cached_direct_access(page: Page, element: Mock) -> None:
+    class MyRegion(Region):
+        _root_locator = (By.ID, "test")
+        _cache_root = True
+
+        @property
+        def loaded(self) -> bool:
+            return self.root.get_attribute("class") == "loaded"
+
+    element.get_attribute.return_value = "loaded"
+    region = MyRegion(page)
+    assert page.driver.find_element.call_count == 1  # type: ignore
+
+    # Direct root access is not revalidated...
+    element.get_attribute.side_effect = StaleElementReferenceException()
+    assert region.root is element
+    assert page.driver.find_element.call_count == 1  # type: ignore
+
+    # ...but waiting for the region looks the root up again.
+    fresh = Mock()
+    fresh.get_attribute.return_value = "loaded"
+    page.driver.find_element.return_value = fresh  # type: ignore
+    assert region.wait_for_region_to_load().root is fresh